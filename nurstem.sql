@@ -274,4 +274,70 @@ CREATE TABLE historial_consumo (
     CONSTRAINT fk_consumo_med FOREIGN KEY(medicamento_id) REFERENCES medicamento(id),
     CONSTRAINT fk_consumo_enf FOREIGN KEY(enfermero_id) REFERENCES enfermero(id),
     CONSTRAINT fk_consumo_pac FOREIGN KEY(paciente_id) REFERENCES paciente(id)
-);
\ No newline at end of file
+);
+-- Stock por lote (Medicamento.stock es la suma); las salidas se asignan por FEFO
+CREATE TABLE lote_medicamento (
+    id SERIAL PRIMARY KEY,
+    lote VARCHAR(100),
+    fecha_caducidad DATE,
+    cantidad INT NOT NULL DEFAULT 0,
+    fecha_ingreso TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    medicamento_id INT NOT NULL,
+    CONSTRAINT fk_lote_med FOREIGN KEY(medicamento_id) REFERENCES medicamento(id)
+);
+
+-- Kardex: libro de movimientos de stock (solo inserción)
+CREATE TABLE movimiento_stock (
+    id SERIAL PRIMARY KEY,
+    fecha_hora TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    cantidad INT NOT NULL,       -- Positiva = entrada, negativa = salida
+    saldo INT NOT NULL,          -- Stock después del movimiento
+    tipo VARCHAR(30) NOT NULL,   -- 'alta', 'entrada', 'salida', 'consumo', 'administracion', 'transferencia'
+    motivo VARCHAR(100),
+    medicamento_id INT NOT NULL,
+    lote_id INT,
+    inventario_id INT,           -- Ubicación afectada
+    enfermero_id INT,
+    paciente_id INT,
+    CONSTRAINT fk_mov_med FOREIGN KEY(medicamento_id) REFERENCES medicamento(id),
+    CONSTRAINT fk_mov_lote FOREIGN KEY(lote_id) REFERENCES lote_medicamento(id),
+    CONSTRAINT fk_mov_inv FOREIGN KEY(inventario_id) REFERENCES inventariofarmacia(id),
+    CONSTRAINT fk_mov_enf FOREIGN KEY(enfermero_id) REFERENCES enfermero(id),
+    CONSTRAINT fk_mov_pac FOREIGN KEY(paciente_id) REFERENCES paciente(id)
+);
+
+-- Fotos periódicas del saldo (incluyen todos los movimientos hasta movimiento_id)
+CREATE TABLE saldo_stock (
+    id SERIAL PRIMARY KEY,
+    fecha_hora TIMESTAMP NOT NULL,
+    saldo INT NOT NULL,
+    movimiento_id INT,
+    medicamento_id INT NOT NULL,
+    CONSTRAINT fk_saldo_med FOREIGN KEY(medicamento_id) REFERENCES medicamento(id)
+);
+
+-- Existencia de cada producto por ubicación (medicamento.stock = suma de todas)
+CREATE TABLE stock_ubicacion (
+    id SERIAL PRIMARY KEY,
+    cantidad INT NOT NULL DEFAULT 0,
+    nivel_objetivo INT,          -- Nivel al que se rellena en el reabastecimiento
+    medicamento_id INT NOT NULL,
+    inventario_id INT NOT NULL,
+    CONSTRAINT uq_stock_ubicacion UNIQUE (medicamento_id, inventario_id),
+    CONSTRAINT fk_ubic_med FOREIGN KEY(medicamento_id) REFERENCES medicamento(id),
+    CONSTRAINT fk_ubic_inv FOREIGN KEY(inventario_id) REFERENCES inventariofarmacia(id)
+);
+
+-- ###############################################################
+-- # 3. ÍNDICES, COLUMNAS NUEVAS Y RESTRICCIONES
+-- ###############################################################
+
+-- No se mantienen aquí: las tablas que la aplicación agrega (curso, inscripcion,
+-- asignacion, lista_espera, ...), las columnas nuevas de tablas existentes, los
+-- índices (incluido el de trigramas con pg_trgm) y las restricciones únicas los
+-- crea la aplicación desde sus modelos, tanto en una BD nueva como en una ya en uso:
+--
+--     flask --app app migrar-esquema
+--
+-- (también corre al arrancar app.py). Antes de cada restricción única fusiona
+-- los duplicados existentes, así que se puede correr sobre datos reales.